@@ -25,6 +25,9 @@ from pathlib import Path
 from typing import Literal, Union, cast
 from typing_extensions import Optional
 from dymo_bluetooth.bluetooth import discover_printers, create_code_128, create_image
+from functools import lru_cache
+import errno
+import stat
 import sys
 import asyncio
 import os
@@ -41,26 +44,31 @@ async def print_image(
     barcode: Optional[str]
 ):
     if barcode:
-        canvas = create_code_128(barcode)
+        canvas = create_code_128(
+            barcode, 
+            stretch = stretch_factor, 
+            reverse = reverse, 
+            padding = padding
+        )
     else:
-        canvas = create_image(input_file, dither = use_dither)
-    if stretch_factor != 1:
-        canvas = canvas.stretch(factor = stretch_factor)
-    if padding != 0:
-        canvas = canvas.fill(padding, padding)
-    if reverse:
-        canvas = canvas.revert()
+        canvas = create_image(
+            input_file, 
+            dither = use_dither, 
+            stretch = stretch_factor, 
+            reverse = reverse, 
+            padding = padding
+        )
 
     if is_preview:
         print(canvas.text(False if is_preview == "large" else True))
-        exit(0)
+        sys.exit(0)
 
     print(f"Image size: {canvas.size}", file = sys.stderr)
     print(f"Searching for nearby printers to print (timeout: {max_timeout})...", file = sys.stderr)
     printers = await discover_printers(max_timeout, ensure_mac)
     if not printers:
         print("Couldn't find any printers, is the printer online?", file = sys.stderr)
-        exit(1)
+        sys.exit(1)
     printer = printers[0]
     print(f"Found: {printer._impl.address}", file = sys.stderr)
     await printer.connect()
@@ -70,7 +78,8 @@ async def print_image(
     await printer.disconnect()
 
 
-def main():
+@lru_cache(maxsize = 1)
+def _build_parser() -> ArgumentParser:
     module_name = cast(str, sys.modules[__name__].__file__).split(os.sep)[-2]
     args = ArgumentParser(
         prog = f"python -m {module_name}",
@@ -151,11 +160,9 @@ def main():
             "applied to it. The default is 'small', which is the recommended option."
         )
     )
-    barcode_writer_installed = False
     try:
         from barcode import Code128 # type: ignore
         from barcode.writer import ImageWriter # type: ignore
-        barcode_writer_installed = True
         args.add_argument(
             "--barcode",
             type = str,
@@ -166,7 +173,11 @@ def main():
         )
     except ModuleNotFoundError:
         pass
-    parsed = args.parse_args()
+    return args
+
+
+def main():
+    parsed = _build_parser().parse_args()
     input_file = cast(Path, parsed.image).absolute()
     max_timeout = cast(int, parsed.timeout)
     stretch_factor = cast(int, parsed.stretch)
@@ -174,15 +185,21 @@ def main():
     ensure_mac = cast(bool, parsed.ensure_mac)
     padding = cast(int, parsed.padding)
     reverse = cast(bool, parsed.reverse)
-    barcode = cast(str, parsed.barcode) if barcode_writer_installed else None
+    barcode = cast(Optional[str], getattr(parsed, "barcode", None))
     is_preview = cast(Union[None, Literal["large", "small"]], parsed.preview)
 
-    if not input_file.exists() and not barcode:
-        print(f"Input file doesn't exists: {input_file.as_posix()}", file = sys.stderr)
-        exit(1)
-    if input_file.is_dir() and not barcode:
-        print(f"Input file can't be a directory: {input_file.as_posix()}", file = sys.stderr)
-        exit(1)
+    if not barcode:
+        try:
+            input_stat = input_file.stat()
+        except OSError as error:
+            # Only the errors that `Path.exists()` treats as a missing file.
+            if error.errno not in (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP):
+                raise
+            print(f"Input file doesn't exists: {input_file.as_posix()}", file = sys.stderr)
+            sys.exit(1)
+        if stat.S_ISDIR(input_stat.st_mode):
+            print(f"Input file can't be a directory: {input_file.as_posix()}", file = sys.stderr)
+            sys.exit(1)
 
     asyncio.run(print_image(
         input_file, 
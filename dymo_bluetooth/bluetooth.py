@@ -21,16 +21,16 @@
 # SOFTWARE.
 
 import asyncio
-from io import BytesIO
+from functools import lru_cache
 from pathlib import Path
 from sys import stderr, platform
-from PIL import Image, ImageChops
-from bleak import BleakScanner, BleakClient
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, Set, Union, TYPE_CHECKING
 from dymo_bluetooth.printer import Canvas, Result, command_print
 
 if TYPE_CHECKING:
+    from PIL import Image
     from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
     from bleak.backends.characteristic import BleakGATTCharacteristic
 
 
@@ -42,59 +42,96 @@ PRINT_REPLY_UUID = "be3dd652-{uuid}-42f1-99c1-f0f749dd0678".format(uuid = "2b3d"
 UNKNOWN_UUID = "be3dd653-{uuid}-42f1-99c1-f0f749dd0678".format(uuid = "2b3d")
 
 
+# MAC address prefixes (OUI) of Espressif Inc.
+ESPRESSIF_MAC_BLOCKS = frozenset(
+    int(mac.replace(":", ""), base = 16) for mac in (
+        "58:CF:79",
+        "DC:54:75", # confirmed in #2
+        "34:85:18", # confirmed in #4
+    )
+)
+
+
+@lru_cache(maxsize = 256)
 def is_espressif(input_mac: str):
     """
     Returns True if given MAC address is from Espressif Inc.
     """
-    mac_blocks = [
-        "58:CF:79",
-        "DC:54:75", # confirmed in #2
-        "34:85:18", # confirmed in #4
-    ]
     check_mac = int(input_mac.replace(":", ""), base = 16)
-    for mac in mac_blocks:
-        start_block = int(mac.replace(":", ""), base = 16) << 24
-        end_block = start_block + (1 << 24) # Exclusive
-        if (check_mac >= start_block) and (check_mac < end_block):
-            return True
-    return False
+    return (check_mac >> 24) in ESPRESSIF_MAC_BLOCKS
 
 
 class Printer:
     def __init__(self, impl: "BLEDevice") -> None:
+        from bleak import BleakClient
+
         self._impl = impl
         self._client = BleakClient(self._impl)
+        self._print_request: Optional["BleakGATTCharacteristic"] = None
+        self._print_reply: Optional["BleakGATTCharacteristic"] = None
     
     async def connect(self):
         if self._client.is_connected:
             return
         await self._client.connect()
+        self._resolve_characteristics()
+
+    def _resolve_characteristics(self):
+        # Resolve the characteristics once, so they don't need to be looked up
+        # again on each print.
+        self._print_request = self._client.services.get_characteristic(PRINT_REQUEST_UUID)
+        self._print_reply = self._client.services.get_characteristic(PRINT_REPLY_UUID)
     
     async def disconnect(self):
         if not self._client.is_connected:
             return
         await self._client.disconnect()
+        self._print_request = None
+        self._print_reply = None
 
     async def print(self, canvas: Canvas):
         if not self._client.is_connected:
             raise Exception("Printer is not connected!")
-        print_request: "BleakGATTCharacteristic" = self._client.services.get_characteristic(PRINT_REQUEST_UUID) # type: ignore # noqa: E501
-        print_reply: "BleakGATTCharacteristic" = self._client.services.get_characteristic(PRINT_REPLY_UUID) # type: ignore # noqa: E501
+        if (self._print_request is None) or (self._print_reply is None):
+            self._resolve_characteristics()
+        print_request: "BleakGATTCharacteristic" = self._print_request # type: ignore
+        print_reply: "BleakGATTCharacteristic" = self._print_reply # type: ignore
         future: asyncio.Future[Result] = asyncio.Future()
         should_discard: bool = False
         # Printer sends two messages, first is the PRINTING, and second one is the 
         # printing result. So we discard the first message.
         async def reply_get(_, data: bytearray): # noqa: E501
             nonlocal should_discard
-            result = Result.from_bytes(data)
-            if (not should_discard) and (result.value in [0, 1]):
+            # Check the raw status value, so the discarded message isn't parsed.
+            if (not should_discard) and (data[2] in (0, 1)):
                 should_discard = True
                 return
             # This is the second reply, which holds the actual status code. 
-            future.set_result(result)
+            future.set_result(Result.from_bytes(data))
         await self._client.start_notify(print_reply, reply_get)
-        for chunk in command_print(canvas):
-            await self._client.write_gatt_char(print_request, chunk, True)
+        # If the printer accepts writes without response, don't wait for an
+        # acknowledgement of each chunk before sending the next one.
+        no_response = "write-without-response" in print_request.properties
+        # Create the next chunks while the current one is being written.
+        queue: "asyncio.Queue[Union[bytearray, Exception, None]]" = asyncio.Queue(maxsize = 4)
+        async def produce():
+            try:
+                for chunk in command_print(canvas):
+                    await queue.put(chunk)
+            except Exception as error:
+                await queue.put(error)
+            else:
+                await queue.put(None)
+        producer = asyncio.ensure_future(produce())
+        try:
+            while (chunk := await queue.get()) is not None:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                with_response = (not no_response) or \
+                    (len(chunk) > print_request.max_write_without_response_size)
+                await self._client.write_gatt_char(print_request, chunk, with_response)
+        finally:
+            producer.cancel()
         return await future
 
 
@@ -104,82 +141,136 @@ async def discover_printers(max_timeout: int = 5, ensure_mac: bool = False) -> L
     has found in the initial search, waits for scanning until the max timeout has been 
     reached.
     """
+    from bleak import BleakScanner
+
     printers: List[Printer] = []
-    waited_total = 0
-    async with BleakScanner(service_uuids = [SERVICE_UUID]) as scanner:
-        while True:
-            # TODO: In some cases, advetisement data may be non-null, containing
-            # additional metadata about printer state but it is not implemented yet.
-            for device, _ in scanner.discovered_devices_and_advertisement_data.values():
-                has_valid_name = (device.name or "").startswith("Letratag")
-                if (platform != "darwin") and has_valid_name:
-                    has_valid_name = (device.name or "").endswith(device.address.replace(':', ''))
-                if not has_valid_name:
-                    continue
-                if ensure_mac and (not is_espressif(device.address)):
-                    print(
-                        f"A possible printer is found, but its MAC {device.address} isn't whitelisted, " +
-                        "thus ignored. If it isn't right, either disable MAC checking or open a issue.",
-                        file = stderr
-                    )
-                    continue
-                printers.append(Printer(device))
-            # Do we have any candidate printers? If so, return the found printers. 
-            # Otherwise, wait for the next scans until we found any.
-            if printers:
-                break
-            elif waited_total >= max_timeout:
+    # Addresses of printers that have been already checked, since the same device
+    # is reported again on each advertisement.
+    seen: Set[str] = set()
+    loop = asyncio.get_running_loop()
+    # Resolved with True when a printer has been found, or with False
+    # when the max timeout has been reached.
+    found: "asyncio.Future[bool]" = loop.create_future()
+
+    def resolve(value: bool):
+        if not found.done():
+            found.set_result(value)
+
+    # TODO: In some cases, advetisement data may be non-null, containing
+    # additional metadata about printer state but it is not implemented yet.
+    def on_detection(device: "BLEDevice", _: "AdvertisementData"):
+        if device.address in seen:
+            return
+        name = device.name or ""
+        if not name.startswith("Letratag"):
+            return
+        # Name ends with the MAC address, but macOS doesn't expose MAC addresses
+        # of devices, so it can only be checked on other platforms.
+        if (platform != "darwin") and (not name.endswith(device.address.replace(':', ''))):
+            return
+        # Name may not be known in the first advertisement, so only the devices
+        # with a matching name are skipped afterwards.
+        seen.add(device.address)
+        if ensure_mac and (not is_espressif(device.address)):
+            print(
+                f"A possible printer is found, but its MAC {device.address} isn't whitelisted, " +
+                "thus ignored. If it isn't right, either disable MAC checking or open a issue.",
+                file = stderr
+            )
+            return
+        printers.append(Printer(device))
+        resolve(True)
+
+    async with BleakScanner(detection_callback = on_detection, service_uuids = [SERVICE_UUID]):
+        # Return as soon as a candidate printer has been found, otherwise wait
+        # for the next scans until we found any.
+        timeout = loop.call_later(max_timeout, resolve, False)
+        try:
+            if not (await found):
                 return []
-            await asyncio.sleep(0.5)
-            waited_total += 0.5
+        finally:
+            timeout.cancel()
     return printers
 
 
 def convert_image_to_canvas(
-    image: Image.Image, 
+    image: "Image.Image", 
     dither: bool = True,
-    trim: bool = False
+    trim: bool = False,
+    stretch: int = 1,
+    reverse: bool = False,
+    padding: int = 0
 ):
     """
-    Converts an Pillow Image to a Canvas object.
+    Converts an Pillow Image to a Canvas object. If `stretch` is higher than 1, the
+    image will be stretched to the non-fixed direction in N times. If `reverse` is True,
+    the image will be flipped in color. If `padding` is given, N blank pixels will be
+    added to both sides of the image, which are also flipped in color if `reverse` is True.
     """
+    from PIL import Image, ImageChops
+
+    if stretch < 1:
+        raise ValueError("Stretch factor must be at least 1!")
+    if padding < 0:
+        raise ValueError("Padding can't be negative!")
+    # If the image won't fit in the canvas, fail before paying for the conversion.
+    # Trimming may make the image short enough, so then it is checked after trimming.
+    if not trim:
+        Canvas._raise_if_too_long((image.width * stretch) + (padding * 2))
     output = image.convert("1", dither = \
         Image.Dither.FLOYDSTEINBERG if dither else Image.Dither.NONE
     )
     # If trim is enabled, discard trailing and leading blank lines.
     if trim:
-        mask = Image.new("1", output.size, color = 255)
-        diff = ImageChops.difference(output, mask)
-        output = output.crop(diff.getbbox(alpha_only = False))
-    # Convert image to pixel array.
-    canvas = Canvas()
+        # Black pixels are zero in monochrome images, so invert it to get
+        # the bounding box of the black pixels.
+        output = output.crop(ImageChops.invert(output).getbbox())
+        Canvas._raise_if_too_long((output.width * stretch) + (padding * 2))
     # Shrink the image from the center if it exceeds the print height,
     # or max printable width.
-    if (output.height > canvas.height):
-        start_y = int(output.height / 2) - int(canvas.height / 2)
+    if (output.height > Canvas.FIXED_EDGE_PIXELS):
+        start_y = int(output.height / 2) - int(Canvas.FIXED_EDGE_PIXELS / 2)
         output = output.crop(
-            (0, start_y, output.width, start_y + canvas.height)
+            (0, start_y, output.width, start_y + Canvas.FIXED_EDGE_PIXELS)
         )
-    for w in range(output.width):
-        for h in range(output.height):
-            pixel = output.getpixel((w, h, ))
-            canvas.set_pixel(w, h, not pixel)
-    return canvas
+    if stretch != 1:
+        output = output.resize((output.width * stretch, output.height), Image.Resampling.NEAREST)
+    # Place the image on a 32 pixel high strip (4 bytes for each line), starting from
+    # the second pixel as the printer expects. Padding is left on both sides of the strip.
+    strip = Image.new("1", (output.width + (padding * 2), 32), color = 255)
+    strip.paste(output, (padding, 1))
+    # Rotate the strip, so each line becomes a row starting from the last pixel, and let
+    # Pillow pack the rows with the reversed bit order, which results in the same layout
+    # of the canvas; the first pixel is stored in the last byte of each line. Black pixels
+    # are stored as set bits, so the bits are also inverted, unless reversing the colors,
+    # which flips the whole strip along with the padding, same as `Canvas.revert()`.
+    data = strip.transpose(Image.Transpose.ROTATE_270).tobytes("raw", "1;R" if reverse else "1;IR")
+    return Canvas.from_bytes(data)
 
 
-def create_image(path: Path, dither: bool = True):
+def create_image(
+    path: Path, 
+    dither: bool = True,
+    stretch: int = 1,
+    reverse: bool = False,
+    padding: int = 0
+):
     """
     Converts an image file in given path to Canvas.
     """
-    buffer = BytesIO()
-    with path.open("rb") as op:
-        buffer.write(op.read())
-    buffer.seek(0)
-    image = Image.open(buffer)
-    return convert_image_to_canvas(image, dither)
+    from PIL import Image
+
+    with Image.open(path) as image:
+        return convert_image_to_canvas(
+            image, 
+            dither, 
+            stretch = stretch, 
+            reverse = reverse, 
+            padding = padding
+        )
 
 
-def create_code_128(text: str):
+def create_code_128(text: str, stretch: int = 1, reverse: bool = False, padding: int = 0):
     """
     Creates a Code 128 barcode and dumps to Canvas.
     """
@@ -191,4 +282,11 @@ def create_code_128(text: str):
     imwrite = ImageWriter()
     imwrite.dpi = 200
     code = Code128(text, writer = imwrite)
-    return convert_image_to_canvas(code.render(text = ""), dither = False, trim = True)
+    return convert_image_to_canvas(
+        code.render(text = ""), 
+        dither = False, 
+        trim = True, 
+        stretch = stretch, 
+        reverse = reverse, 
+        padding = padding
+    )
@@ -21,9 +21,7 @@
 # SOFTWARE.
 
 from enum import Enum
-from io import SEEK_END, BytesIO
 from typing import Literal, Sequence, Tuple
-import math
 
 class DirectiveCommand(Enum):
     """
@@ -37,9 +35,13 @@ class DirectiveCommand(Enum):
     STATUS = "A"
     END = "Q"
 
-    def to_bytes(self) -> bytes:
+    def __init__(self, value: str) -> None:
+        # Directives never change, so create the bytes once for each directive.
         # 27 = ASCII escape sequence
-        return bytes((27, ord(self.value), ))
+        self._bytes = bytes((27, ord(value), ))
+
+    def to_bytes(self) -> bytes:
+        return self._bytes
 
 
 class Result(Enum):
@@ -75,17 +77,26 @@ class Result(Enum):
     def from_bytes(cls, data: Sequence[int]):
         if data[0] != 27:
             raise ValueError("Not a valid result value; 1st byte must be 0x1b (27)")
-        if chr(data[1]) != "R":
+        if data[1] != 82:
             raise ValueError("Not a valid result value; 2nd byte must be 0x52 (82)")
-        # There is a value 5, which also means printing has completed but has
-        # a different status value, so we return FAILED since that's what it means.
-        if data[2] == 5:
-            return cls(Result.FAILED.value)
-        # There is a value 1, which also means printing has completed but has
-        # a different status value, so we return SUCCESS since that's what it means.
-        if data[2] == 1:
-            return cls(Result.SUCCESS.value)
-        return cls(data[2])
+        result = _RESULT_STATUSES.get(data[2])
+        # Unknown status values are left to the enum, which raises for them.
+        if result is None:
+            return cls(data[2])
+        return result
+
+
+_RESULT_STATUSES = {result.value: result for result in Result}
+# There is a value 5, which also means printing has completed but has
+# a different status value, so we return FAILED since that's what it means.
+_RESULT_STATUSES[5] = Result.FAILED
+# There is a value 1, which also means printing has completed but has
+# a different status value, so we return SUCCESS since that's what it means.
+_RESULT_STATUSES[1] = Result.SUCCESS
+
+
+# Flipped value of each byte, for flipping all bytes of an image at once.
+_COMPLEMENT_TABLE = bytes(value ^ 0xFF for value in range(256))
 
 
 class Canvas:
@@ -103,11 +114,44 @@ class Canvas:
     # the printer can actually print 30 pixels in height.
     FIXED_EDGE_PIXELS = 30
 
+    # Count of bytes for each line.
+    FIXED_EDGE_SIZE = (FIXED_EDGE_PIXELS + 7) >> 3
+
     # Maximum count of pixels that the image can extend into the unfixed edge.
     UNFIXED_EDGE_MAX_PIXELS = 8000
 
-    def __init__(self) -> None:
-        self.buffer = BytesIO()
+    def __init__(self, width: int = 0) -> None:
+        # Blank lines can be allocated upfront if the width of the image is already
+        # known, so the buffer doesn't need to grow while setting pixels.
+        if width < 0:
+            raise ValueError("Width can't be negative!")
+        self._raise_if_too_long(width)
+        self.buffer = bytearray(width * self.FIXED_EDGE_SIZE)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Canvas":
+        """
+        Creates a Canvas from already packed image data, in the same layout that
+        `get_image()` returns, so the whole image can be loaded at once instead of
+        setting each pixel one by one.
+
+        Each line of the image (a column of pixels) takes 4 bytes, starting from
+        the second bit of the last byte, with the most significant bit first. If
+        the last line is incomplete, it will be padded with blank pixels.
+        """
+        canvas = cls()
+        canvas.buffer = bytearray(data)
+        canvas.buffer.extend(bytes(-len(data) % canvas._get_fixed_edge_size()))
+        canvas._raise_if_too_long(canvas.width)
+        return canvas
+
+    @classmethod
+    def _raise_if_too_long(cls, width: int):
+        max_unfixed = cls.UNFIXED_EDGE_MAX_PIXELS
+        if width > max_unfixed:
+            raise ValueError(
+                f"Image is too long (got {width} pixels, but expected at most {max_unfixed})"
+            )
 
     def get_pixel(self, x: int, y: int) -> bool:
         """
@@ -117,15 +161,12 @@ class Canvas:
         self._raise_if_out_bounds(x, y)
 
         # Get the byte containing the pixel value of given coordinates.
-        # We add 1 to Y here since printer expects the first pixel starting from second bit.
-        bytes_per_line = self._get_fixed_edge_size()
-        x_offset = x * bytes_per_line
-        y_offset = bytes_per_line - 1 - math.floor((y + 1) / 8)
-        self.buffer.seek(x_offset + y_offset)
+        index = (x * self.FIXED_EDGE_SIZE) + _Y_OFFSETS[y]
+        if index >= len(self.buffer):
+            return False
 
         # Check if there is a bit value in given line.
-        value = (self.buffer.read(1) or b"\x00")[0]
-        is_black = bool(value & (1 << (7 - ((y + 1) % 8))))
+        is_black = bool(self.buffer[index] & _Y_MASKS[y])
         return is_black
 
     def set_pixel(self, x: int, y: int, color: Literal[True, False, 0, 1]) -> None:
@@ -134,26 +175,56 @@ class Canvas:
         Setting color to True will paint a black color.
         """
         self._raise_if_out_bounds(x, y)
-
-        # Get the byte containing the pixel value of given coordinates.
-        # We add 1 to Y here since printer expects the first pixel starting from second bit.
+        self._set_pixel_unchecked(x, y, color)
+
+    def set_pixels(
+        self, 
+        xs: Sequence[int], 
+        ys: Sequence[int], 
+        colors: Sequence[Literal[True, False, 0, 1]]
+    ) -> None:
+        """
+        Sets multiple pixels at once, each pixel is given by the values in the same 
+        position of `xs`, `ys` and `colors`. All coordinates are checked before 
+        changing any pixel, so nothing is changed if any of them is out of bounds.
+        """
+        if not (len(xs) == len(ys) == len(colors)):
+            raise ValueError("Coordinates and colors must have the same length!")
+        if len(xs) == 0:
+            return
+        # Check the bounds only once with the smallest and the largest coordinates,
+        # and only look for the pixel that is out of bounds when there is one.
+        max_x = max(xs)
+        if not (self.is_in_bounds(min(xs), min(ys)) and self.is_in_bounds(max_x, max(ys))):
+            for x, y in zip(xs, ys):
+                self._raise_if_out_bounds(x, y)
+        # Extend the image once until the farthest line, instead of for each line.
         bytes_per_line = self._get_fixed_edge_size()
-        x_offset = x * bytes_per_line
-        y_offset = bytes_per_line - 1 - math.floor((y + 1) / 8)
-        self.buffer.seek(x_offset + y_offset)
+        size = (max_x + 1) * bytes_per_line
+        if size > len(self.buffer):
+            self.buffer.extend(bytes(size - len(self.buffer)))
+        buffer = self.buffer
+        for x, y, color in zip(xs, ys, colors):
+            if color:
+                buffer[(x * bytes_per_line) + _Y_OFFSETS[y]] |= _Y_MASKS[y]
+            else:
+                buffer[(x * bytes_per_line) + _Y_OFFSETS[y]] &= ~_Y_MASKS[y]
+
+    def _set_pixel_unchecked(self, x: int, y: int, color: Literal[True, False, 0, 1]) -> None:
+        # Get the byte containing the pixel value of given coordinates.
+        x_offset = x * self.FIXED_EDGE_SIZE
+
+        # If the line doesn't exist yet, extend the image with blank lines until the
+        # given line is included.
+        if x_offset >= len(self.buffer):
+            self.buffer.extend(bytes(x_offset + self.FIXED_EDGE_SIZE - len(self.buffer)))
 
         # Get the one of four slices in line in the given coordinates. Add the bit in
         # given location if color is black, otherwise exclude the bit to make it white.
-        curr = self.buffer.read(1)
-        value = (curr or b"\x00")[0]
         if color:
-            value = value | (1 << (7 - ((y + 1) % 8)))
+            self.buffer[x_offset + _Y_OFFSETS[y]] |= _Y_MASKS[y]
         else:
-            value = value & ~(1 << (7 - ((y + 1) % 8)))
-
-        # Change the current byte with modified one, if not exists, append a new one.
-        self.buffer.seek(0 if not curr else -1, 1)
-        self.buffer.write(bytes([value]))
+            self.buffer[x_offset + _Y_OFFSETS[y]] &= ~_Y_MASKS[y]
 
     def stretch(self, factor: int = 2) -> "Canvas":
         """
@@ -162,21 +233,26 @@ class Canvas:
         """
         if factor < 1:
             raise ValueError("Stretch factor must be at least 1!")
+        if factor == 1:
+            return self.copy()
+        # Each line is stored in its own bytes, so stretching is only repeating
+        # the bytes of each line N times. Instead of going through each line, copy
+        # each byte position of all lines at once to their new positions.
+        self._raise_if_too_long(self.width * factor)
+        bytes_per_line = self._get_fixed_edge_size()
+        source = self.get_image()
         canvas = Canvas()
-        for x in range(self.width):
-            for y in range(self.height):
-                pixel = self.get_pixel(x, y)
-                start_x = (x * factor)
-                for i in range(factor):
-                    canvas.set_pixel(start_x + i, y, pixel)
+        canvas.buffer = bytearray(len(source) * factor)
+        step = bytes_per_line * factor
+        for i in range(step):
+            canvas.buffer[i::step] = source[i % bytes_per_line::bytes_per_line]
         return canvas
 
     def _get_byte_size(self):
-        self.buffer.seek(0, SEEK_END)
-        return self.buffer.tell()
+        return len(self.buffer)
 
     def _get_unfixed_edge_px(self):
-        return math.ceil(self._get_byte_size() / self._get_fixed_edge_size())
+        return (len(self.buffer) + self.FIXED_EDGE_SIZE - 1) // self.FIXED_EDGE_SIZE
 
     def _get_unfixed_edge_max_px(self):
         return self.UNFIXED_EDGE_MAX_PIXELS
@@ -185,21 +261,16 @@ class Canvas:
         return self.FIXED_EDGE_PIXELS
 
     def _get_fixed_edge_size(self):
-        return math.ceil(self.FIXED_EDGE_PIXELS / 8)
+        return self.FIXED_EDGE_SIZE
 
     def is_in_bounds(self, x: int, y: int):
         """
         Checks if both coordinates is in bounds of printable area.
         """
-        if (x < 0) or (y < 0):
-            return False
-        max_fixed = self._get_fixed_edge_px()
-        max_unfixed = self._get_unfixed_edge_max_px()
-        return not ((y >= max_fixed) or (x >= max_unfixed))
+        return (0 <= x < self.UNFIXED_EDGE_MAX_PIXELS) and (0 <= y < self.FIXED_EDGE_PIXELS)
 
     def _raise_if_out_bounds(self, x: int, y: int):
-        result = self.is_in_bounds(x, y)
-        if not result:
+        if not self.is_in_bounds(x, y):
             max_fixed = self._get_fixed_edge_px()
             max_unfixed = self._get_unfixed_edge_max_px()
             raise ValueError(
@@ -232,47 +303,40 @@ class Canvas:
         """
         Gets the created image with added blank padding.
         """
-        self.buffer.seek(0)
-        image = bytearray(self.buffer.read())
-        image.extend(bytes(self.buffer.tell() % self._get_fixed_edge_size()))
-        return bytes(image)
+        # Lines are always added as a whole, so the buffer only needs to be copied
+        # once. Pad the last line to a complete line if it is somehow incomplete.
+        padding = -len(self.buffer) % self._get_fixed_edge_size()
+        if not padding:
+            return bytes(self.buffer)
+        return bytes(self.buffer + bytes(padding))
 
     def empty(self):
         """
         Makes all pixels in the canvas in blank (= white). Canvas size won't be changed.
         """
-        size = self._get_byte_size()
-        self.buffer.seek(0)
-        self.buffer.truncate(0)
-        self.buffer.seek(size)
-        self.buffer.write(b"\x00")
+        self.buffer = bytearray(self._get_byte_size())
 
     def copy(self) -> "Canvas":
         """
         Creates a copy of this canvas.
         """
         canvas = Canvas()
-        self.buffer.seek(0)
-        canvas.buffer.write(self.buffer.read())
+        canvas.buffer = self.buffer[:]
         return canvas
 
     def clear(self):
         """
         Clears the canvas. Canvas size will be changed to 0.
         """
-        self.buffer.seek(0)
-        self.buffer.truncate(0)
+        self.buffer.clear()
 
     def revert(self):
         """
         Returns a new Canvas with the image is flipped in color; all unfilled 
         pixels are filled, and all filled pixels are unfilled.
         """
-        self.buffer.seek(0)
         copied = Canvas()
-        copied.buffer.seek(0)
-        while (byt := self.buffer.read(1)):
-            copied.buffer.write(bytes([byt[0] ^ 0xFF]))
+        copied.buffer = self.buffer.translate(_COMPLEMENT_TABLE)
         return copied
 
     def fill(self, to_left: int, to_right: int) -> "Canvas":
@@ -280,12 +344,12 @@ class Canvas:
         Returns a new Canvas with blank (= white) spacing added to both sides.
         """
         bytes_per_line = self._get_fixed_edge_size()
+        image = self.get_image()
+        start = to_left * bytes_per_line
+        # Allocate the blank image at once, then copy the image to its place.
         canv = Canvas()
-        canv.buffer.seek(0)
-        canv.buffer.write(bytes(to_left * bytes_per_line))
-        canv.buffer.write(self.get_image())
-        canv.buffer.seek(0, SEEK_END)
-        canv.buffer.write(bytes(to_right * bytes_per_line))
+        canv.buffer = bytearray(start + len(image) + (to_right * bytes_per_line))
+        canv.buffer[start:start + len(image)] = image
         return canv
 
     def pad(self, until: int) -> "Canvas":
@@ -294,10 +358,12 @@ class Canvas:
         to the given width in pixels. Returns a new Canvas containing the modified image.
         If image is already longer than given width, returns the copy of the same image.
         """
-        if self.width >= until:
+        width = self.width
+        if width >= until:
             return self.copy()
-        side = math.ceil((until - self.width) / 2)
-        return self.fill(side, side)
+        # If the spacing can't be split evenly, the right side gets the extra pixel.
+        left = (until - width) >> 1
+        return self.fill(left, until - width - left)
 
     def text(self, in_quad: bool = True, blank_char: int = 0x20, frame: bool = True) -> str:
         """
@@ -307,34 +373,53 @@ class Canvas:
         character. Empty pixels will be represented as `blank_char` (default is SPACE).
         """
         lines = []
+        width, height = self.size
         frame_length = 0
         if frame:
-            frame_length = self.width if not in_quad else math.ceil(self.width / 2)
+            frame_length = width if not in_quad else ((width + 1) >> 1)
+        # Vertical frame line for both sides of each line.
+        side = chr(0x2502) if frame else ""
         if frame_length:
             lines.append(chr(0x250C) + (frame_length * chr(0x2500)) + chr(0x2510))
         if in_quad:
-            for h in range(0, self.height, 2):
-                line = ""
-                for w in range(0, self.width, 2):
-                    corners = \
-                        self.get_pixel(w, h), \
-                        self.get_pixel(w + 1, h), \
-                        self.get_pixel(w, h + 1), \
-                        self.get_pixel(w + 1, h + 1)
-                    corners = sum([1 << x if corners[x] else 0 for x in range(4)])
-                    line += chr(quartet_to_char(corners) or blank_char)
-                if frame:
-                    line = chr(0x2502) + line + chr(0x2502)
-                lines.append(line)
+            # Characters for each 4 bit value, with blank one replaced by `blank_char`.
+            quartets = chr(blank_char) + "".join(map(chr, QUARTET_CHARS[1:]))
+            # Read the corners from the bytes directly, instead of getting each pixel.
+            # A blank line is added to the end, in case if width is an odd number.
+            bytes_per_line = self._get_fixed_edge_size()
+            step = bytes_per_line * 2
+            buffer = bytes(self.buffer) + bytes(bytes_per_line)
+            for h in range(0, height, 2):
+                # Byte offset and bit mask of the top and the bottom pixel in each line,
+                # so the bytes of a row can be taken in a single slice.
+                top, top_mask = _Y_OFFSETS[h], _Y_MASKS[h]
+                bottom, bottom_mask = _Y_OFFSETS[h + 1], _Y_MASKS[h + 1]
+                line = "".join(
+                    quartets[
+                        (1 if top_left & top_mask else 0) |
+                        (2 if top_right & top_mask else 0) |
+                        (4 if bottom_left & bottom_mask else 0) |
+                        (8 if bottom_right & bottom_mask else 0)
+                    ]
+                    for top_left, top_right, bottom_left, bottom_right in zip(
+                        buffer[top::step],
+                        buffer[top + bytes_per_line::step],
+                        buffer[bottom::step],
+                        buffer[bottom + bytes_per_line::step]
+                    )
+                )
+                lines.append(side + line + side)
         else:
-            lines = []
-            for h in range(0, self.height):
-                line = ""
-                for w in range(0, self.width):
-                    line += chr(0x2588 if self.get_pixel(w, h) else blank_char)
-                if frame:
-                    line = chr(0x2502) + line + chr(0x2502)
-                lines.append(line)
+            filled, blank = chr(0x2588), chr(blank_char)
+            bytes_per_line = self._get_fixed_edge_size()
+            for h in range(0, height):
+                # Each byte in the slice is a pixel of this row from a different line.
+                mask = _Y_MASKS[h]
+                line = "".join(
+                    filled if value & mask else blank
+                    for value in self.buffer[_Y_OFFSETS[h]::bytes_per_line]
+                )
+                lines.append(side + line + side)
         if frame_length:
             lines.append(chr(0x2514) + (frame_length * chr(0x2500)) + chr(0x2518))
         return "\n".join(lines)
@@ -348,13 +433,46 @@ class Canvas:
     def __eq__(self, value: object, /) -> bool:
         if not isinstance(value, Canvas):
             return False
-        return value.get_image() == self.get_image()
+        # Buffers always contain whole lines, so they can be compared directly
+        # without copying them with the padding added.
+        return self.buffer == value.buffer
 
     def __repr__(self) -> str:
         w, h = self.size
         return f"<{self.__class__.__name__} size={w}x{h} length={self.__len__()}>"
 
 
+# Unicode block symbol codes for each 4 bit value, see `quartet_to_char()`.
+# https://en.wikipedia.org/wiki/Block_Elements
+QUARTET_CHARS = (
+    0x0000, # Blank
+    0x2598, # 0001
+    0x259D, # 0010
+    0x2580, # 0011
+    0x2596, # 0100
+    0x258C, # 0101
+    0x259E, # 0110
+    0x259B, # 0111
+    0x2597, # 1000
+    0x259A, # 1001
+    0x2590, # 1010
+    0x259C, # 1011
+    0x2584, # 1100
+    0x2599, # 1101
+    0x259F, # 1110
+    0x2588, # 1111
+)
+
+
+# Offset of the byte in each line and the mask of the bit in that byte for each Y
+# coordinate, so they are not calculated on each pixel access. We add 1 to Y here
+# since printer expects the first pixel starting from second bit.
+_Y_OFFSETS = tuple(
+    Canvas.FIXED_EDGE_SIZE - 1 - ((y + 1) >> 3) for y in range(Canvas.FIXED_EDGE_PIXELS)
+)
+_Y_MASKS = tuple(1 << (7 - ((y + 1) & 7)) for y in range(Canvas.FIXED_EDGE_PIXELS))
+
+
 def quartet_to_char(char: int):
     """
     Gets a unicode block symbol code for a 4 bit value (0x0 to 0xF), each bit representing
@@ -363,26 +481,14 @@ def quartet_to_char(char: int):
     """
     if (char > 0xF) or (char < 0x0):
         raise ValueError("Invalid character.")
-    # https://en.wikipedia.org/wiki/Block_Elements
-    data = {
-        0x0: 0x0000, # Blank
-        0x1: 0x2598, # 0001
-        0x2: 0x259D, # 0010
-        0x3: 0x2580, # 0011
-        0x4: 0x2596, # 0100
-        0x5: 0x258C, # 0101
-        0x6: 0x259E, # 0110
-        0x7: 0x259B, # 0111
-        0x8: 0x2597, # 1000
-        0x9: 0x259A, # 1001
-        0xA: 0x2590, # 1010
-        0xB: 0x259C, # 1011
-        0xC: 0x2584, # 1100
-        0xD: 0x2599, # 1101
-        0xE: 0x259F, # 1110
-        0xF: 0x2588, # 1111
-    }
-    return data[char]
+    return QUARTET_CHARS[char]
+
+
+# [154, 2, 0, 0] is the "job ID".
+# Without that, printer won't print anything but a small blank label.
+# This the only "job ID" that the printer uses in start directive, it is not
+# related with some sort of queue or anything else, just a constant value.
+_START_DIRECTIVE = DirectiveCommand.START.to_bytes() + bytes((154, 2, 0, 0, ))
 
 
 class DirectiveBuilder:
@@ -392,31 +498,28 @@ class DirectiveBuilder:
 
     @staticmethod
     def start():
-        # [154, 2, 0, 0] is the "job ID".
-        # Without that, printer won't print anything but a small blank label.
-        # This the only "job ID" that the printer uses in start directive, it is not
-        # related with some sort of queue or anything else, just a constant value.
-        return bytes([*DirectiveCommand.START.to_bytes(), 154, 2, 0, 0])
+        # Start directive never changes, so it is created once.
+        return _START_DIRECTIVE
 
     @staticmethod
     def media_type(value: int):
-        return bytes([*DirectiveCommand.MEDIA_TYPE.to_bytes(), value])
+        return DirectiveCommand.MEDIA_TYPE.to_bytes() + bytes((value, ))
 
     @staticmethod
     def form_feed():
-        return bytes(DirectiveCommand.FORM_FEED.to_bytes())
+        return DirectiveCommand.FORM_FEED.to_bytes()
     
     @staticmethod
     def status():
-        return bytes(DirectiveCommand.STATUS.to_bytes())
+        return DirectiveCommand.STATUS.to_bytes()
     
     @staticmethod
     def end():
-        return bytes(DirectiveCommand.END.to_bytes())
+        return DirectiveCommand.END.to_bytes()
 
     @staticmethod
     def print(
-        data: Sequence[int],
+        data: bytes,
         image_width: int,
         image_height: int,
         bits_per_pixel: int, 
@@ -425,13 +528,18 @@ class DirectiveBuilder:
         size = \
             image_width.to_bytes(4, "little") + \
             image_height.to_bytes(4, "little")
-        return bytes([
-            *DirectiveCommand.PRINT_DATA.to_bytes(), 
-            bits_per_pixel, 
-            alignment, 
-            *size,
-            *data
-        ])
+        # Image data is already in bytes, so it is copied once to the result.
+        return \
+            DirectiveCommand.PRINT_DATA.to_bytes() + \
+            bytes((bits_per_pixel, alignment, )) + \
+            size + \
+            bytes(data)
+
+
+# Start of the each payload header, which doesn't change; preamble, flags and MAGIC.
+# Sum of its bytes is also stored, since it is always the same part of the checksum.
+_HEADER_START = b"\xff\xf0\x12\x34"
+_HEADER_START_SUM = sum(_HEADER_START)
 
 
 def create_payload(data: Sequence[int], is_print: bool = False):
@@ -443,20 +551,15 @@ def create_payload(data: Sequence[int], is_print: bool = False):
     """
     # Longer inputs needs to be splitted.
     CHUNK_SIZE = 500
-    # Magic value.
-    MAGIC = [18, 52]
+    # Magic value, [18, 52].
+    MAGIC = b"\x12\x34"
     # Length of the data in 4 bytes.
     length = len(data).to_bytes(4, "little")
-    # byte[9] = [255, 240, 18, 52, ...LENGTH{4}, CHECKSUM]
-    header = bytearray([
-        255, # Preamble
-        240, # Flags
-        *MAGIC,
-        *length
-    ])
     # For checksum, we get the sum of all bytes, then get the first byte of the sum.
-    checksum = sum(header) & 0xFF
-    header.append(checksum)
+    # All bytes except the length are constant, so only the length needs to be summed.
+    checksum = (_HEADER_START_SUM + length[0] + length[1] + length[2] + length[3]) & 0xFF
+    # byte[9] = [255, 240, 18, 52, ...LENGTH{4}, CHECKSUM]
+    header = bytearray(_HEADER_START + length + bytes((checksum, )))
     assert len(header) == 9, "Header must be 9 bytes"
     # Payloads other than writing doesn't require chunking, 
     # so the input data can be added as-is.
@@ -467,18 +570,21 @@ def create_payload(data: Sequence[int], is_print: bool = False):
     else:
         # First yield the header.
         yield header
+        # Slice the data without copying, chunks are copied once to their own buffer.
+        view = memoryview(data if isinstance(data, (bytes, bytearray)) else bytes(data))
         # Split chunk in each 500 bytes.
-        for index, step in enumerate(range(0, len(data), CHUNK_SIZE)):
-            current_chunk = bytearray()
-            chunk = data[step: step + CHUNK_SIZE]
+        for index, step in enumerate(range(0, len(view), CHUNK_SIZE)):
+            chunk = view[step: step + CHUNK_SIZE]
+            is_last = (step + CHUNK_SIZE) >= len(view)
             # TODO: Not sure what is the purpose of the this, but the original
             # vendor app skips this index, so we do the same here.
             chunk_index = index + 1 if index >= 27 else index
-            current_chunk.append(chunk_index)
-            current_chunk.extend(chunk)
+            current_chunk = bytearray(1 + len(chunk) + (len(MAGIC) if is_last else 0))
+            current_chunk[0] = chunk_index
+            current_chunk[1:1 + len(chunk)] = chunk
             # If this is the last chunk, append MAGIC to the end.
-            if (step + CHUNK_SIZE) >= len(data):
-                current_chunk.extend(MAGIC)
+            if is_last:
+                current_chunk[-len(MAGIC):] = MAGIC
             yield current_chunk
 
 
@@ -488,20 +594,22 @@ def command_print(
     """
     Creates a print directive.
     """
-    payload = bytearray()
-    payload.extend(DirectiveBuilder.start())
-    payload.extend(DirectiveBuilder.print(
-        canvas.get_image(), 
-        canvas.width,
-        # Seems printer doesn't mind if it is either 30 (same as `canvas.height`)
-        # or 32 (4 bytes * 8 bits), but let's keep it in 32 anyway.
-        32,
-        bits_per_pixel = 1, 
-        alignment = 2
+    # Join the directives at once, so the image isn't copied again for each one.
+    payload = b"".join((
+        DirectiveBuilder.start(),
+        DirectiveBuilder.print(
+            canvas.get_image(), 
+            canvas.width,
+            # Seems printer doesn't mind if it is either 30 (same as `canvas.height`)
+            # or 32 (4 bytes * 8 bits), but let's keep it in 32 anyway.
+            32,
+            bits_per_pixel = 1, 
+            alignment = 2
+        ),
+        DirectiveBuilder.form_feed(),
+        DirectiveBuilder.status(),
+        DirectiveBuilder.end()
     ))
-    payload.extend(DirectiveBuilder.form_feed())
-    payload.extend(DirectiveBuilder.status())
-    payload.extend(DirectiveBuilder.end())
     return create_payload(payload, is_print = True)
 
 
@@ -511,8 +619,9 @@ def command_casette(
     """
     Creates a casette directive.
     """
-    payload = bytearray()
-    payload.extend(DirectiveBuilder.start())
-    payload.extend(DirectiveBuilder.media_type(media_type))
-    payload.extend(DirectiveBuilder.end())
+    payload = b"".join((
+        DirectiveBuilder.start(),
+        DirectiveBuilder.media_type(media_type),
+        DirectiveBuilder.end()
+    ))
     return create_payload(payload)
\ No newline at end of file